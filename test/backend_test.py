@@ -1,7 +1,13 @@
-from unittest import TestCase
+import warnings
+
+import numpy as np
+import torch
+
+from unittest import TestCase, skipUnless
 from tucker_riemopt import set_backend
+from tucker_riemopt import backend as back
 
-import tucker.tucker_test as tucker_test
+from test.tucker import tucker_test
 
 class BackendTest(TestCase):
     def testJaxBackend(self):
@@ -25,4 +31,73 @@ class BackendTest(TestCase):
 
     def testBackend(self):
         self.testJaxBackend()
-        self.testPytorchBackend()
\ No newline at end of file
+        self.testPytorchBackend()
+
+    def testAll(self):
+        set_backend("pytorch")
+        result = back.all(back.tensor([True, True, False]))
+        assert back.is_tensor(result) and isinstance(result.item(), bool) and not result
+        assert back.all(back.tensor([[1., 2.], [3., 4.]]) > 0)
+
+    def testClip(self):
+        set_backend("pytorch")
+        x = back.tensor([-2., -1., 0., 1., 2.])
+        y = back.clip(x, None, None)
+        assert y is not x and np.allclose(back.to_numpy(y), back.to_numpy(x))
+        assert back.clip(x, None, None, inplace=True) is x
+        assert np.allclose(back.to_numpy(back.clip(x, a_min=0)), [0., 0., 0., 1., 2.])
+        assert np.allclose(back.to_numpy(x), [-2., -1., 0., 1., 2.])
+        assert np.allclose(back.to_numpy(back.clip(x, a_max=1)), [-2., -1., 0., 1., 1.])
+        y = back.clip(x, -1, 1, inplace=True)
+        assert y is x and np.allclose(back.to_numpy(x), [-1., -1., 0., 1., 1.])
+
+    def testToNumpy(self):
+        set_backend("pytorch")
+        x = back.tensor([1., 2., 3.], requires_grad=True)
+        assert isinstance(back.to_numpy(x), np.ndarray)
+        assert np.allclose(back.to_numpy(x), [1., 2., 3.])
+
+    @skipUnless(torch.cuda.is_available(), "CUDA is not available")
+    def testToNumpyCuda(self):
+        set_backend("pytorch")
+        x = back.tensor([1., 2., 3.], device="cuda")
+        assert np.allclose(back.to_numpy(x), [1., 2., 3.])
+
+    @skipUnless(torch.cuda.device_count() > 1, "Multiple CUDA devices are not available")
+    def testToNumpyNonCurrentDevice(self):
+        set_backend("pytorch")
+        x = back.randn((1024, 1024), device="cuda:1")
+        expected = x.cpu().numpy()
+        with torch.cuda.device(0):
+            for _ in range(10):
+                assert np.array_equal(back.to_numpy(x * 1), expected)
+
+    def testNorm(self):
+        set_backend("pytorch")
+        np.random.seed(229)
+        A = np.random.randn(3, 4, 5)
+        At = back.tensor(A, dtype=back.float64)
+        for ord, axis in [(None, None), (None, 1), (None, (0, 2)), (2, 0), (2, (0,)), (1, (2,)),
+                          (np.inf, -1), ("fro", (0, 1)), ("nuc", (1, 2)), (2, (0, 2))]:
+            assert np.allclose(back.to_numpy(back.norm(At, ord=ord, axis=axis)),
+                               np.linalg.norm(A, ord=ord, axis=axis))
+        for ord in [None, 1, 2, np.inf]:
+            assert np.allclose(back.to_numpy(back.norm(At[0, 0], ord=ord)), np.linalg.norm(A[0, 0], ord=ord))
+        for ord in [None, 1, 2, "fro", "nuc", np.inf]:
+            assert np.allclose(back.to_numpy(back.norm(At[0], ord=ord)), np.linalg.norm(A[0], ord=ord))
+        with self.assertRaises(RuntimeError):
+            back.norm(At, ord=2)
+
+    def testTensor(self):
+        set_backend("pytorch")
+        for data in [np.arange(3, dtype=">f4"), np.broadcast_to(np.arange(3.), (2, 3)), np.arange(6.)[::-2]]:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                x = back.tensor(data)
+            assert np.allclose(back.to_numpy(x), data)
+        t = torch.ones(3)
+        x = back.tensor(t, requires_grad=True)
+        assert x is not t and x.requires_grad and not t.requires_grad
+        t = torch.ones(3, requires_grad=True)
+        x = back.tensor(2 * t)
+        assert x.grad_fn is None and not x.requires_grad
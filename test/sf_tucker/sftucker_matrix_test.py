@@ -1,9 +1,11 @@
 import numpy as np
 
 from unittest import TestCase
+from unittest.mock import patch
 
 from tucker_riemopt import SFTuckerMatrix
 from tucker_riemopt import backend as back
+from tucker_riemopt.sf_tucker import matrix as sf_matrix
 
 
 class SFTuckerMatrixTest(TestCase):
@@ -32,3 +34,37 @@ class SFTuckerMatrixTest(TestCase):
             matrix_tucker = SFTuckerMatrix.from_dense(matrix_dense, num_shared_factors, (2, 2, 2), (2, 2, 2))
             y = matrix_tucker @ x
             assert np.allclose(back.to_numpy(y_dense), back.to_numpy(back.reshape(y, (10, 8))), atol=1e-5)
+
+    def testToBf16Matmul(self):
+        matrix_dense = back.randn((4, 4, 4))
+        x = back.randn((10, 2, 2, 2))
+        for num_shared_factors in [1, 2, 3]:
+            matrix_tucker = SFTuckerMatrix.from_dense(matrix_dense, num_shared_factors, (2, 2, 2), (2, 2, 2))
+            matrix_bf16 = matrix_tucker.to_bf16()
+            self.assertEqual(matrix_bf16.shared_factor.dtype, back.bfloat16)
+            self.assertEqual((matrix_bf16.n, matrix_bf16.m), (matrix_tucker.n, matrix_tucker.m))
+            assert np.allclose(back.to_numpy(matrix_bf16 @ x), back.to_numpy(matrix_tucker @ x), rtol=1e-2, atol=1e-1)
+
+    def testDenseMatmulSharedContraction(self):
+        # rectangular operator with n != m, contracted both with the Kronecker product of shared factors and mode by mode
+        np.random.seed(229)
+        for ds in [2, 3]:
+            n, m = (2,) + (3,) * ds, (2,) + (2,) * ds
+            matrix_tucker = SFTuckerMatrix(back.tensor(np.random.randn(2, *([3] * ds))),
+                                           [back.tensor(np.random.randn(4, 2))], ds,
+                                           back.tensor(np.random.randn(6, 3)), n, m)
+            matrix_dense = back.to_numpy(matrix_tucker.to_dense()).reshape(sum(zip(n, m), ()), order="F")
+            for batch_shape in [(), (7,), (2, 5)]:
+                x = np.random.randn(*batch_shape, *n)
+                operand_letters, result_letters = "abcd"[:ds + 1], "ABCD"[:ds + 1]
+                y_dense = np.einsum("".join(sum(zip(operand_letters, result_letters), ())) + ",..." + operand_letters +
+                                    "->..." + result_letters, matrix_dense, x)
+                for max_size, max_flop_ratio, use_kron in [(0, np.inf, False), (2 ** 40, np.inf, True)]:
+                    with patch.object(sf_matrix, "SHARED_KRON_MAX_SIZE", max_size), \
+                            patch.object(sf_matrix, "SHARED_KRON_MAX_FLOP_RATIO", max_flop_ratio):
+                        operator = SFTuckerMatrix(matrix_tucker.core, matrix_tucker.regular_factors, ds,
+                                                  matrix_tucker.shared_factor, n, m)
+                        self.assertEqual(operator._shared_kron is not None, use_kron)
+                        y = operator @ back.tensor(x)
+                    self.assertEqual(tuple(y.shape), batch_shape + m)
+                    assert np.allclose(back.to_numpy(y), y_dense, atol=1e-4)
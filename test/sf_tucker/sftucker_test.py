@@ -25,6 +25,15 @@ class TuckerTensorTest(TestCase):
         self.assertEqual(A2.rank, [8, 8])
         assert np.allclose((2 * A).to_dense(), A2.to_dense())
 
+    def testAddMixedPrecision(self):
+        A32 = self.createTestTensor(self.n)
+        A64 = SFTucker(back.astype(A32.core, back.float64), [back.astype(A32.regular_factors[0], back.float64)], 2,
+                       back.astype(A32.shared_factor, back.float64))
+        for A_sum in [A32 + A64, A64 + A32]:
+            self.assertEqual(A_sum.dtype, back.float64)
+            self.assertEqual(A_sum.shared_factor.dtype, back.float64)
+            assert np.allclose(back.to_numpy(A_sum.to_dense()), 2 * back.to_numpy(A64.to_dense()), atol=1e-4)
+
     def testNorm(self):
         A = self.createTestTensor(self.n)
         assert np.allclose(A.norm(qr_based=False), back.norm(A.to_dense()))
@@ -50,3 +59,36 @@ class TuckerTensorTest(TestCase):
         for ds in [1, 2, 3]:
             A_sftucker = SFTucker.from_tucker(A_tucker, ds)
             assert np.allclose(back.to_numpy(A_sftucker.to_dense()), back.to_numpy(A), atol=1e-5)
+
+    def testOrthonormalFactors(self):
+        A = back.randn((10, 10, 10))
+        A_sftucker = SFTucker.from_dense(A, ds=2)
+        assert A_sftucker._factors_orthonormal
+        A_plain = SFTucker(A_sftucker.core, A_sftucker.regular_factors, A_sftucker.ds, A_sftucker.shared_factor)
+        assert np.allclose(back.to_numpy(A_sftucker.norm(qr_based=True)), back.to_numpy(A_plain.norm(qr_based=True)))
+        assert np.allclose(back.to_numpy(A_sftucker.flat_inner(A_sftucker)), back.to_numpy(A_plain.flat_inner(A_plain)),
+                           rtol=1e-4)
+        assert not A_sftucker.to_bf16()._factors_orthonormal
+        assert not (A_sftucker + A_sftucker)._factors_orthonormal
+
+        A_sftucker.shared_factor = 2 * A_sftucker.shared_factor
+        assert not A_sftucker._factors_orthonormal
+        assert np.allclose(back.to_numpy(A_sftucker.norm(qr_based=True)), 4 * back.to_numpy(back.norm(A)), rtol=1e-4)
+
+    def testToBf16(self):
+        A = back.randn((6, 6, 6))
+        A_sftucker = SFTucker.from_dense(A, ds=2)
+        A_bf16 = A_sftucker.to_bf16()
+        self.assertEqual(A_bf16.regular_factors[0].dtype, back.bfloat16)
+        self.assertEqual(A_bf16.shared_factor.dtype, back.bfloat16)
+        self.assertEqual(A_bf16.dtype, A_sftucker.dtype)
+        assert np.allclose(back.to_numpy(A_bf16.to_dense()), back.to_numpy(A), rtol=1e-2, atol=1e-1)
+        assert np.allclose(back.to_numpy(A_bf16.norm()), back.to_numpy(back.norm(A)), rtol=1e-2)
+        assert np.allclose(back.to_numpy(A_bf16.norm(qr_based=True)), back.to_numpy(back.norm(A)), rtol=1e-2)
+        assert np.allclose(back.to_numpy(A_bf16.round(A_sftucker.rank).to_dense()), back.to_numpy(A),
+                           rtol=1e-2, atol=1e-1)
+        M = back.randn((6, 6))
+        assert np.allclose(back.to_numpy(A_bf16.k_mode_product(0, M).to_dense()),
+                           back.to_numpy(A_sftucker.k_mode_product(0, M).to_dense()), rtol=1e-2, atol=1e-1)
+        assert np.allclose(back.to_numpy(A_bf16.shared_modes_product(M).to_dense()),
+                           back.to_numpy(A_sftucker.shared_modes_product(M).to_dense()), rtol=1e-2, atol=1e-1)
@@ -31,3 +31,12 @@ class TuckerMatrixTest(TestCase):
         matrix_tucker = TuckerMatrix.from_dense(matrix_dense, (2, 2, 2), (2, 2, 2))
         y = matrix_tucker @ x
         assert np.allclose(back.to_numpy(y_dense), back.to_numpy(back.reshape(y, (10, 8))), atol=1e-5)
+
+    def testToBf16Matmul(self):
+        matrix_dense = back.randn((4, 4, 4))
+        x = back.randn((10, 2, 2, 2))
+        matrix_tucker = TuckerMatrix.from_dense(matrix_dense, (2, 2, 2), (2, 2, 2))
+        matrix_bf16 = matrix_tucker.to_bf16()
+        self.assertEqual(matrix_bf16.factors[0].dtype, back.bfloat16)
+        self.assertEqual((matrix_bf16.n, matrix_bf16.m), (matrix_tucker.n, matrix_tucker.m))
+        assert np.allclose(back.to_numpy(matrix_bf16 @ x), back.to_numpy(matrix_tucker @ x), rtol=1e-2, atol=1e-1)
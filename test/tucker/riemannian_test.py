@@ -142,3 +142,13 @@ class RiemannianTest(TestCase):
         
         assert (true_norm - computed_norm) < 1e-5
 
+
+    def testGradBf16(self):
+        set_backend("pytorch")
+        np.random.seed(229)
+        T = self.createTestTensor(4)
+        riem_grad, fx = TuckerRiemannian.grad(self.f, T)
+        riem_grad_bf16, fx_bf16 = TuckerRiemannian.grad(self.f, T.to_bf16())
+        assert np.allclose(back.to_numpy(fx_bf16), back.to_numpy(fx), rtol=1e-2, atol=1e-1)
+        assert np.allclose(back.to_numpy(riem_grad_bf16.construct().to_dense()),
+                           back.to_numpy(riem_grad.construct().to_dense()), rtol=1e-2, atol=1e-1)
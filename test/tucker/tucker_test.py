@@ -34,6 +34,15 @@ class TuckerTensorTest(TestCase):
         self.assertEqual(A2.rank, (2, 2, 2))
         assert np.allclose((2 * A).to_dense(), A2.to_dense())
 
+    def testAddMixedPrecision(self):
+        A = self.createTestTensor(self.n)
+        A64 = Tucker.from_dense(A, eps=1e-6)
+        A32 = Tucker(back.astype(A64.core, back.float32), [back.astype(factor, back.float32) for factor in A64.factors])
+        for A_sum in [A32 + A64, A64 + A32]:
+            self.assertEqual(A_sum.dtype, back.float64)
+            self.assertEqual(A_sum.factors[0].dtype, back.float64)
+            assert np.allclose(back.to_numpy(A_sum.to_dense()), 2 * back.to_numpy(A), atol=1e-4)
+
     def testMul(self):
         A = self.createTestTensor(self.n)
         A_tuck = Tucker.from_dense(A, eps=1e-6)
@@ -57,3 +66,47 @@ class TuckerTensorTest(TestCase):
         assert np.allclose(A_tuck.k_mode_product(0, M).to_dense(), Z)
         assert np.allclose(A_tuck.k_mode_product(1, M).to_dense(), Z)
         assert np.allclose(A_tuck.k_mode_product(2, M).to_dense(), Z)
+
+    def testOrthonormalFactors(self):
+        A = self.createTestTensor(self.n)
+        A_tuck = Tucker.from_dense(A, eps=1e-6)
+        assert A_tuck._factors_orthonormal
+        A_plain = Tucker(A_tuck.core, A_tuck.factors)
+        assert not A_plain._factors_orthonormal
+        assert np.allclose(A_tuck.flat_inner(A_tuck), A_plain.flat_inner(A_plain))
+        assert np.allclose(A_tuck.flat_inner(A_tuck), back.norm(A) ** 2)
+        assert np.allclose(A_tuck.norm(qr_based=True), A_plain.norm(qr_based=True))
+        assert np.allclose(A_tuck.norm(qr_based=True), back.norm(A))
+        # short-circuits rely on the flag only
+        A_scaled = Tucker(A_tuck.core, [2 * factor for factor in A_tuck.factors])._mark_orthonormal()
+        assert np.allclose(A_scaled.norm(qr_based=True), back.norm(A_tuck.core))
+        assert np.allclose(A_scaled.flat_inner(A_scaled), back.norm(A_tuck.core) ** 2)
+
+        M = back.randn((self.n, self.n), dtype=A.dtype)
+        assert not A_tuck.k_mode_product(0, M)._factors_orthonormal
+        assert not (A_tuck + A_tuck)._factors_orthonormal
+        assert not A_tuck.to_bf16()._factors_orthonormal
+        assert (2 * A_tuck)._factors_orthonormal
+
+        A_tuck.factors = [2 * factor for factor in A_tuck.factors]
+        assert not A_tuck._factors_orthonormal
+        assert np.allclose(A_tuck.norm(qr_based=True), 8 * back.norm(A))
+        assert np.allclose(A_tuck.flat_inner(A_tuck), 64 * back.norm(A) ** 2)
+
+    def testToBf16(self):
+        A = self.createTestTensor(self.n)
+        A_tuck = Tucker.from_dense(A, eps=1e-6)
+        A_bf16 = A_tuck.to_bf16()
+        self.assertEqual(A_bf16.factors[0].dtype, back.bfloat16)
+        self.assertEqual(A_bf16.dtype, A_tuck.dtype)
+        assert np.allclose(back.to_numpy(A_bf16.to_dense()), back.to_numpy(A), rtol=1e-2, atol=1e-1)
+        assert np.allclose(back.to_numpy(A_bf16.norm()), back.to_numpy(back.norm(A)), rtol=1e-2)
+        assert back.to_numpy(A_bf16.factors[0]).shape == tuple(A_bf16.factors[0].shape)
+        assert np.allclose(back.to_numpy(A_bf16.round(A_tuck.rank).to_dense()), back.to_numpy(A), rtol=1e-2, atol=1e-1)
+        M = back.randn((self.n, self.n), dtype=A.dtype)
+        assert np.allclose(back.to_numpy(A_bf16.k_mode_product(0, M).to_dense()),
+                           back.to_numpy(A_tuck.k_mode_product(0, M).to_dense()), rtol=1e-2, atol=1e-1)
+        assert np.allclose(back.to_numpy((A_bf16 * A_tuck).to_dense()), back.to_numpy(A * A), rtol=1e-2, atol=1)
+        assert np.allclose(back.to_numpy(A_bf16[1, 2, 3]), back.to_numpy(A[1, 2, 3]), rtol=1e-2)
+        assert np.allclose(back.to_numpy(A_bf16[np.array([[1, 2, 3], [0, 1, 2]])]),
+                           back.to_numpy(A)[[1, 0], [2, 1], [3, 2]], rtol=1e-2)
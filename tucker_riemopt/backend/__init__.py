@@ -26,16 +26,16 @@ class dynamically_dispatched_class_attribute(object):
 class BackendManager(types.ModuleType):
     _functions = ["reshape", "any", "trace", "shape", "ndim",
                   "where", "copy", "transpose", "arange", "ones", "zeros",
-                  "zeros_like", "eye", "kron", "concatenate", "max", "min", "matmul",
-                  "all", "mean", "sum", "cumsum", "prod", "sign", "abs", "sqrt", "argmin",
+                  "zeros_like", "update_index", "astype", "result_type", "contiguous", "eye", "kron", "concatenate", "max", "min", "matmul",
+                  "tensordot", "all", "mean", "sum", "cumsum", "prod", "sign", "abs", "sqrt", "argmin",
                   "argmax", "stack", "conj", "diag", "einsum", "log2", "dot",
                   "sin", "cos", "clip", "khatri_rao", "lstsq", "eps", "finfo",
                   "solve", "qr", "randn", "check_random_state", "sort", "eigh",
                   "context", "tensor", "norm", "to_numpy", "is_tensor",
-                  "argsort", "flip", "count_nonzero", "svd", "squeeze", "grad", "pad",
+                  "argsort", "flip", "count_nonzero", "svd", "squeeze", "grad", "jit", "pad",
                   "cho_factor", "cho_solve", "lu_factor", "lu_solve"
                   ]
-    _attributes = ["type", "int64", "int32", "float64", "float32",
+    _attributes = ["type", "int64", "int32", "float64", "float32", "bfloat16",
                    "complex128", "complex64", "SVD_FUNS", "index", "backend_name"]
     available_backend_names = ["pytorch", "jax"]
     _default_backend = "pytorch"
@@ -38,6 +38,10 @@ class Backend(object):
     def float32(self):
         raise NotImplementedError
 
+    @property
+    def bfloat16(self):
+        raise NotImplementedError
+
     @property
     def complex128(self):
         raise NotImplementedError
@@ -123,6 +127,41 @@ class Backend(object):
     def zeros_like(tensor):
         raise NotImplementedError
 
+    @staticmethod
+    def astype(tensor, dtype):
+        raise NotImplementedError
+
+    @staticmethod
+    def result_type(a, b):
+        """
+        Dtype resulting from type promotion of two tensors.
+        :param a: tensor
+        :param b: tensor
+        :return: promoted dtype
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def contiguous(tensor):
+        """
+        Return tensor with row-major memory layout. Backends without strided tensors return `tensor` itself.
+        :param tensor: tensor
+        :return: contiguous tensor
+        """
+        return tensor
+
+    @staticmethod
+    def update_index(tensor, index, values):
+        """
+        Assign `values` to `tensor[index]`. Update may be performed inplace, so the result should be used instead
+        of `tensor` afterwards.
+        :param tensor: tensor to update
+        :param index: index or tuple of slices
+        :param values: values to assign
+        :return: updated tensor
+        """
+        raise NotImplementedError
+
     @staticmethod
     def diag(diagnoal):
         raise NotImplementedError
@@ -211,6 +250,10 @@ class Backend(object):
     def matmul(a, b):
         raise NotImplementedError
 
+    @staticmethod
+    def tensordot(a, b, axes=2):
+        raise NotImplementedError
+
     @staticmethod
     def solve(a, b):
         raise NotImplementedError
@@ -301,6 +344,17 @@ class Backend(object):
     def grad(func: typing.Callable, argnums: typing.Union[int, typing.Sequence[int]] = 0):
         raise NotImplementedError
 
+    @staticmethod
+    def jit(func: typing.Callable):
+        """
+        Compile function which accepts and returns only tensors (or lists of tensors). By default, no compilation is
+        performed. Compiled functions should be built from backend primitives (e.g. `tensordot`) rather than `einsum`,
+        which relies on python-level contraction path caches.
+        :param func: function to compile
+        :return: compiled function
+        """
+        return func
+
     @staticmethod
     def pad(tensor, pad_width, constant_values):
         """
@@ -10,6 +10,7 @@ except ImportError as error:
 import numpy
 import copy
 import typing
+import functools
 
 from opt_einsum import contract
 
@@ -96,6 +97,11 @@ class JaxBackend(Backend, backend_name="jax"):
     def grad(func: typing.Callable, argnums: typing.Union[int, typing.Sequence[int]] = 0, retain_graph=False):
         return jax.grad(func, argnums=argnums)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def jit(func: typing.Callable):
+        return jax.jit(func)
+
     @staticmethod
     def pad(tensor, pad_width, mode, **kwargs):
         return jnp.pad(tensor, pad_width, mode=mode, **kwargs)
@@ -104,6 +110,18 @@ class JaxBackend(Backend, backend_name="jax"):
     def einsum(subscripts, *operands):
         return contract(subscripts, *operands, backend="jax")
 
+    @staticmethod
+    def astype(tensor, dtype):
+        return tensor.astype(dtype)
+
+    @staticmethod
+    def result_type(a, b):
+        return jnp.result_type(a, b)
+
+    @staticmethod
+    def update_index(tensor, index, values):
+        return tensor.at[index].set(values)
+
     @staticmethod
     def cho_factor(A, upper=False, **kwargs):
         """
@@ -124,10 +142,10 @@ class JaxBackend(Backend, backend_name="jax"):
         return jax.scipy.linalg.lu_solve(lu_pivots, B)
 
 
-for name in ["int64", "int32", "float64", "float32", "complex128", "complex64", "reshape",
+for name in ["int64", "int32", "float64", "float32", "bfloat16", "complex128", "complex64", "reshape",
              "where", "transpose", "arange", "ones", "zeros", "flip", "trace", "any",
              "zeros_like", "eye", "kron", "concatenate", "max", "min", "matmul",
-             "all", "mean", "sum", "cumsum", "count_nonzero", "prod", "sign", "abs", "sqrt", "argmin",
+             "tensordot", "all", "mean", "sum", "cumsum", "count_nonzero", "prod", "sign", "abs", "sqrt", "argmin",
              "argmax", "stack", "conj", "diag", "clip", "log2", "sin", "cos", "squeeze"]:
     JaxBackend.register_method(name, getattr(jnp, name))
 
@@ -1,5 +1,6 @@
+import os
 import warnings
-import itertools
+import functools
 import numpy as np
 import typing
 
@@ -13,12 +14,19 @@ except ImportError as error:
                "you must first install PyTorch!")
     raise ImportError(message) from error
 
-from opt_einsum import contract
+from opt_einsum import contract_expression
+from opt_einsum.parser import convert_interleaved_input
 from distutils.version import LooseVersion
 
 from .backend import Backend
 
 linalg_lstsq_avail = LooseVersion(torch.__version__) >= LooseVersion("1.9.0")
+torch_compile_enabled = hasattr(torch, "compile") and os.environ.get("TUCKER_RIEMOPT_TORCH_COMPILE", "0") == "1"
+
+
+@functools.lru_cache(maxsize=128)
+def _contract_expression(subscripts, *shapes):
+    return contract_expression(subscripts, *shapes, optimize="greedy")
 
 
 class PyTorchBackend(Backend, backend_name="pytorch"):
@@ -35,16 +43,38 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
     @staticmethod
     def tensor(data, dtype=torch.float32, device="cpu", requires_grad=False):
         if isinstance(data, np.ndarray):
-            data = data.copy()
-        return torch.tensor(data, dtype=dtype, device=device, requires_grad=requires_grad)
+            # torch.from_numpy supports neither negative strides nor non-native byte order, and warns on read-only
+            # arrays (e.g. from np.broadcast_to)
+            if any(stride < 0 for stride in data.strides) or not data.dtype.isnative or not data.flags.writeable:
+                data = np.array(data, dtype=data.dtype.newbyteorder("="), order="C")
+            tensor = torch.from_numpy(data)
+            if torch.device(device).type == "cuda":
+                tensor = tensor.pin_memory()
+            tensor = tensor.to(device=device, dtype=dtype, non_blocking=True)
+        elif torch.is_tensor(data):
+            # as torch.tensor, never alias or stay attached to the graph of the caller's tensor
+            tensor = data.detach().to(dtype=dtype, device=device, copy=True)
+        else:
+            tensor = torch.as_tensor(data, dtype=dtype, device=device)
+        if requires_grad:
+            tensor.requires_grad_(True)
+        return tensor
 
     @staticmethod
     def to_numpy(tensor):
         if torch.is_tensor(tensor):
             if tensor.requires_grad:
                 tensor = tensor.detach()
-            if tensor.cuda:
-                tensor = tensor.cpu()
+            if tensor.is_cuda:
+                device = tensor.device
+                tensor = tensor.to("cpu", non_blocking=True)
+                # the copy is enqueued on the stream of the tensor's device, which may differ from the current one
+                event = torch.cuda.Event()
+                event.record(torch.cuda.current_stream(device))
+                event.synchronize()
+            if tensor.dtype == torch.bfloat16:
+                # numpy has no bfloat16 type
+                tensor = tensor.float()
             return tensor.numpy()
         elif isinstance(tensor, np.ndarray):
             return tensor
@@ -82,18 +112,16 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
 
     @staticmethod
     def clip(tensor, a_min=None, a_max=None, inplace=False):
-        if a_max is None:
-            a_max = torch.max(tensor)
-        if a_min is None:
-            a_min = torch.min(tensor)
+        if a_min is None and a_max is None:
+            return tensor if inplace else tensor.clone()
         if inplace:
-            return torch.clamp(tensor, a_min, a_max, out=tensor)
+            return torch.clamp(tensor, min=a_min, max=a_max, out=tensor)
         else:
-            return torch.clamp(tensor, a_min, a_max)
+            return torch.clamp(tensor, min=a_min, max=a_max)
 
     @staticmethod
     def all(tensor):
-        return torch.sum(tensor != 0)
+        return torch.all(tensor)
 
     def transpose(self, tensor, axes=None):
         if axes is not None:
@@ -108,6 +136,13 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
 
     @staticmethod
     def norm(tensor, ord=None, axis=None):
+        if isinstance(axis, int):
+            axis = (axis,)
+        if ord is None or (axis is None and tensor.ndim == 1) or (axis is not None and len(axis) == 1):
+            return torch.linalg.vector_norm(tensor, ord=2 if ord is None else ord, dim=axis)
+        if (axis is None and tensor.ndim == 2) or (axis is not None and len(axis) == 2):
+            return torch.linalg.matrix_norm(tensor, ord=ord, dim=(-2, -1) if axis is None else axis)
+        # leaves torch to raise on ambiguous inputs (e.g. `ord` given for a 3D tensor without `axis`)
         return torch.linalg.norm(tensor, ord=ord, dim=axis)
 
     @staticmethod
@@ -118,6 +153,10 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
             return a * b
         return torch.matmul(a, b)
 
+    @staticmethod
+    def tensordot(a, b, axes=2):
+        return torch.tensordot(a, b, dims=axes)
+
     @staticmethod
     def mean(tensor, axis=None):
         if axis is None:
@@ -181,9 +220,22 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
 
         return torch.sort(tensor, dim=axis, descending=descending).values
 
+    @staticmethod
+    def astype(tensor, dtype):
+        return tensor.to(dtype)
+
+    @staticmethod
+    def result_type(a, b):
+        return torch.result_type(a, b)
+
+    @staticmethod
+    def contiguous(tensor):
+        return tensor.contiguous()
+
     @staticmethod
     def update_index(tensor, index, values):
-        tensor.index_put_(index, values)
+        tensor[index] = values
+        return tensor
 
     def solve(self, matrix1, matrix2):
         if self.ndim(matrix2) < 2:
@@ -195,7 +247,9 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
     @staticmethod
     def lstsq(a, b):
         if linalg_lstsq_avail:
-            x, residuals, _, _ = torch.linalg.lstsq(a, b, rcond=None, driver="gelsd")
+            # gelsd is available only on CPU, while CUDA supports only gels driver
+            driver = "gelsd" if a.device.type == "cpu" else "gels"
+            x, residuals, _, _ = torch.linalg.lstsq(a, b, rcond=None, driver=driver)
             return x, residuals
         else:
             n = a.shape[1]
@@ -277,6 +331,15 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
 
         return aux_func
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def jit(func: typing.Callable):
+        if torch_compile_enabled:
+            # shapes are specialized on the first call and marked dynamic on the first recompilation, so tensors of
+            # new ranks do not trigger a recompilation each
+            return torch.compile(func)
+        return func
+
     @staticmethod
     def pad(tensor, pad_width, mode, **kwargs):
         def get_mode_torch(mode_numpy):
@@ -290,7 +353,7 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
                 assert False, f'NumPy mode "{mode_numpy}" has no PyTorch equivalent'
 
         def get_pad_width_torch(pad_width_numpy, mode_torch):
-            pad_width_torch = tuple(itertools.chain.from_iterable(reversed(pad_width_numpy)))
+            pad_width_torch = tuple(p for pair in reversed(pad_width_numpy) for p in pair)
 
             if mode_torch in ['reflect', 'replicate', 'circular']:
                 assert all([p == 0 for p in pad_width_torch[
@@ -299,6 +362,8 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
 
             return pad_width_torch
 
+        if all(before == 0 and after == 0 for before, after in pad_width):
+            return tensor
         mode_torch = get_mode_torch(mode)
         pad_width_torch = get_pad_width_torch(pad_width, mode_torch)
         value = kwargs.get("constant_values")
@@ -307,7 +372,11 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
 
     @staticmethod
     def einsum(subscripts, *operands):
-        return contract(subscripts, *operands, backend="torch")
+        if not isinstance(subscripts, str):
+            # interleaved input: operand, axes, operand, axes, ..., [output axes]
+            subscripts, operands = convert_interleaved_input((subscripts,) + operands)
+        expression = _contract_expression(subscripts, *(tuple(operand.shape) for operand in operands))
+        return expression(*operands, backend="torch")
 
     @staticmethod
     def cho_factor(A, upper=False, **kwargs):
@@ -343,7 +412,7 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
         return res
 
 
-for name in ["float64", "float32", "int64", "int32", "complex128", "complex64",
+for name in ["float64", "float32", "bfloat16", "int64", "int32", "complex128", "complex64",
              "is_tensor", "ones", "zeros", "any", "trace", "count_nonzero",
              "zeros_like", "eye", "min", "prod", "abs", "matmul",
              "sqrt", "sign", "where", "conj", "finfo", "log2", "sin", "cos", "squeeze"]:
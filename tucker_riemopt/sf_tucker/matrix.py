@@ -1,10 +1,17 @@
-from string import ascii_letters
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Sequence, Union
 
 from tucker_riemopt import backend as back
 from tucker_riemopt import SFTucker
 
+# The Kronecker product of shared factors contracts all shared modes of dense operand with a single matmul. It always
+# takes more flops than contracting shared modes one by one and only pays off by saving per-contraction overhead, so
+# it is used if it has at most `SHARED_KRON_MAX_SIZE` elements and takes at most `SHARED_KRON_MAX_FLOP_RATIO` times
+# more flops than the sequential contractions.
+SHARED_KRON_MAX_SIZE = 2 ** 16
+SHARED_KRON_MAX_FLOP_RATIO = 2.5
+
 
 @dataclass()
 class SFTuckerMatrix(SFTucker):
@@ -36,7 +43,57 @@ class SFTuckerMatrix(SFTucker):
         if n is None or m is None:
             raise ValueError("n and m parameter must be specialized for matrices")
         dense_tensor = super().from_dense(dense_tensor, ds, eps)
-        return cls(dense_tensor.core, dense_tensor.regular_factors[:dense_tensor.dt], dense_tensor.ds, dense_tensor.shared_factor, n, m)
+        return cls(dense_tensor.core, dense_tensor.regular_factors[:dense_tensor.dt], dense_tensor.ds,
+                   dense_tensor.shared_factor, n, m)._mark_orthonormal()
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("core", "factors", "shared_factor", "n", "m"):
+            self.__dict__.pop("_reshaped_factors", None)
+            self.__dict__.pop("_reshaped_shared_factor", None)
+            self.__dict__.pop("_shared_kron", None)
+
+    @staticmethod
+    def _reshape_factor(factor: back.type(), n: int, m: int):
+        """Fortran-style reshape of `(n * m, r)` factor into `(n, m, r)` tensor. The result is stored contiguously, so
+        contractions by the source mode map onto `(n, m * r)` matrix without transposes.
+
+        :param factor: Factor of the operator.
+        :param n: Source space dimension of the mode.
+        :param m: Target space dimension of the mode.
+        :return: Reshaped factor.
+        """
+        return back.contiguous(back.transpose(back.reshape(factor, (m, n, -1)), (1, 0, 2)))
+
+    @cached_property
+    def _reshaped_factors(self):
+        return [self._reshape_factor(back.astype(self.factors[i], self.dtype), self.n[i], self.m[i])
+                for i in range(self.dt)]
+
+    @cached_property
+    def _reshaped_shared_factor(self):
+        return self._reshape_factor(back.astype(self.shared_factor, self.dtype), self.n[-1], self.m[-1])
+
+    @cached_property
+    def _shared_kron(self):
+        """Kronecker product of `ds` reshaped shared factors as `(n ** ds, (m * r) ** ds)` matrix. `None` if there is
+        less than two shared modes or the product is too expensive (see `SHARED_KRON_MAX_SIZE` and
+        `SHARED_KRON_MAX_FLOP_RATIO`).
+        """
+        n, m, r = self._reshaped_shared_factor.shape
+        if self.ds < 2 or (n * m * r) ** self.ds > SHARED_KRON_MAX_SIZE:
+            return None
+        # flops per element of leading (batch and regular) modes of the operand; the k-th sequential contraction maps
+        # `n ** (ds - k + 1) * (m * r) ** (k - 1)` elements onto `n ** (ds - k) * (m * r) ** k`
+        kron_flops = (n * m * r) ** self.ds
+        sequential_flops = sum(n ** (self.ds - k + 1) * (m * r) ** k for k in range(1, self.ds + 1))
+        if kron_flops > SHARED_KRON_MAX_FLOP_RATIO * sequential_flops:
+            return None
+        shared_factor = back.reshape(self._reshaped_shared_factor, (n, m * r))
+        kron = shared_factor
+        for _ in range(self.ds - 1):
+            kron = back.kron(kron, shared_factor)
+        return kron
 
     def __matmul__(self, other: Union[back.type(), SFTucker, "SFTuckerMatrix"]):
         """Perform matrix multiplication of tensors. If other's ndim > matrix ndim, then performs batch matmul over last
@@ -49,23 +106,26 @@ class SFTuckerMatrix(SFTucker):
         :return: Dense tensor, SFTucker or SFTuckerMatrix, depends on type of `other`.
         """
         if type(other) == back.type():
-            core_letters = ascii_letters[:self.ndim]
-            factors_letters = []
-            operand_letters = []
-            result_letters = []
-            reshaped_factors = []
-            for i in range(self.ndim):
-                if i < self.dt:
-                    reshaped_factors.append(back.reshape(self.factors[i], (self.n[i], self.m[i], -1), order="F"))
-                factors_letters.append(ascii_letters[self.ndim + 2 * i: self.ndim + 2 * (i + 1)] + core_letters[i])
-                operand_letters.append(factors_letters[-1][0])
-                result_letters.append(factors_letters[-1][1])
-            reshaped_shared_factor = back.reshape(self.shared_factor, (self.n[-1], self.m[-1], -1), order="F")
-            batch_letters = []
-            for i in range(len(other.shape) - self.ndim):
-                batch_letters.append(ascii_letters[2 * (self.ndim + 1) + i + 1])
-            operand_letters = batch_letters + operand_letters
-            result_letters = batch_letters + result_letters
-            return back.einsum(
-                f"{core_letters},{','.join(factors_letters)},{''.join(operand_letters)}->{''.join(result_letters)}",
-                self.core, *reshaped_factors, *([reshaped_shared_factor] * self.ds), other)
+            batch_ndim = len(other.shape) - self.ndim
+            # Shared modes are contracted with the shared factor first, leaving (m, r) axes for each shared mode at
+            # the end of the operand. Small shared factors are applied at once by a single matmul with their Kronecker
+            # product; otherwise shared modes are contracted one by one, each contraction appends (m, r) axes to the
+            # end of the operand, so the next shared mode always takes the same position.
+            if self._shared_kron is not None:
+                leading_shape = tuple(other.shape[:batch_ndim + self.dt])
+                other = back.reshape(other, leading_shape + (-1,)) @ self._shared_kron
+                other = back.reshape(other, leading_shape + tuple(self._reshaped_shared_factor.shape[1:]) * self.ds)
+            else:
+                for _ in range(self.ds):
+                    other = back.tensordot(other, self._reshaped_shared_factor, axes=([batch_ndim + self.dt], [0]))
+
+            # operand axes are `ndim + 2 * i`, result axes are `ndim + 2 * i + 1`, core axes are `i`
+            operands = [self.core, list(range(self.ndim))]
+            for i in range(self.dt):
+                operands += [self._reshaped_factors[i], [self.ndim + 2 * i, self.ndim + 2 * i + 1, i]]
+            batch_axes = list(range(3 * self.ndim, 3 * self.ndim + batch_ndim))
+            operand_axes = batch_axes + [self.ndim + 2 * i for i in range(self.dt)]
+            for i in range(self.dt, self.ndim):
+                operand_axes += [self.ndim + 2 * i + 1, i]
+            result_axes = batch_axes + [self.ndim + 2 * i + 1 for i in range(self.ndim)]
+            return back.einsum(*operands, other, operand_axes, result_axes)
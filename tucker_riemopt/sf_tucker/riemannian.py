@@ -125,6 +125,8 @@ def grad(f: Callable[[SFTucker], float], X: SFTucker, retain_graph=False) -> Tup
     :param retain_graph: Optional argument, which may be provided to autodiff framework (e.g. pytorch).
     :return: A tangent vector of `X` which is the Riemannian gradient of `f` and value `f(X)`.
     """
+    # factors stored in bfloat16 (see `to_bf16`) are not supported by the linear algebra below
+    X = X._to_core_precision()
     fx = None
 
     def h(delta_core, delta_regular_factors, delta_shared_factor):
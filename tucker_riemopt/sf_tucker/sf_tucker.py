@@ -2,12 +2,11 @@ import numpy as np
 import warnings
 
 from typing import List, Union, Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from string import ascii_letters
-from copy import deepcopy
 
 from tucker_riemopt import backend as back
-from tucker_riemopt.tucker.tucker import Tucker
+from tucker_riemopt.tucker.tucker import Tucker, _mode_products, _promote, _gram
 
 
 @dataclass()
@@ -78,7 +77,7 @@ class SFTucker(Tucker):
 
         einsum_str = tensor_letters + "," + ",".join(factor_letters) + "->" + core_letters
         core = back.einsum(einsum_str, dense_tensor, *factors)
-        return cls(core, factors[:dt], ds, factors[-1])
+        return cls(core, factors[:dt], ds, factors[-1])._mark_orthonormal()
 
     @classmethod
     def from_dense(cls, dense_tensor: back.type(), ds: Union[int, None] = None, eps=1e-14):
@@ -145,13 +144,13 @@ class SFTucker(Tucker):
             result_letters.append(ascii_letters[tucker_tensor.ndim+i])
             contract_letters.append(result_letters[-1] + core_letters[dt + i])
         U_concat = back.concatenate(U_concat, axis=1)
-        Q_u, R_u = back.qr(U_concat)
+        Q_u, R_u = back.qr(back.astype(U_concat, tucker_tensor.dtype))
         G_wav_shape += [r_plus] * ds
         G_wav = back.zeros(G_wav_shape)
         G_wav[tuple(G_wav_slices)] = tucker_tensor.core
         core = back.einsum(f"{''.join(core_letters)},{','.join(contract_letters)}->{''.join(result_letters)}",
                            G_wav, *([R_u] * ds))
-        return cls(core, tucker_tensor.factors[:dt], ds, Q_u)
+        return cls(core, tucker_tensor.factors[:dt], ds, Q_u)._mark_orthonormal(tucker_tensor._factors_orthonormal)
 
     @property
     def ndim(self) -> int:
@@ -194,7 +193,7 @@ class SFTucker(Tucker):
 
         :return: Sequence that represents the shape of `SFTucker` tensor.
         """
-        return [self.regular_factors[i].shape[0] for i in range(self.dt)] + [self.shared_factor.shape[0]] * self.ds
+        return [factor.shape[0] for factor in self.factors] + [self.shared_factor.shape[0]] * self.ds
 
     @property
     def rank(self) -> List[int]:
@@ -224,11 +223,12 @@ class SFTucker(Tucker):
                              "Tucker format.")
         r1 = self.rank + [self.core.shape[-1]] * (self.ds - 1)
         r2 = other.rank + [other.core.shape[-1]] * (other.ds - 1)
-        padded_core1 = back.pad(self.core, [(0, r2[j]) if j > 0 else (0, 0) for j in range(self.ndim)],
-                                mode="constant", constant_values=0)
-        padded_core2 = back.pad(other.core, [(r1[j], 0) if j > 0 else (0, 0) for j in range(other.ndim)],
-                                mode="constant", constant_values=0)
-        core = back.concatenate((padded_core1, padded_core2), axis=0)
+        context = back.context(self.core)
+        context.pop("requires_grad", None)
+        context["dtype"] = back.result_type(self.core, other.core)
+        core = back.zeros([r1[j] + r2[j] for j in range(self.ndim)], **context)
+        core = back.update_index(core, tuple(slice(0, r1[j]) for j in range(self.ndim)), self.core)
+        core = back.update_index(core, tuple(slice(r1[j], None) for j in range(self.ndim)), other.core)
         regular_factors = [
             back.concatenate((self.regular_factors[i],
                               other.regular_factors[i]), axis=1) for i in range(self.dt)
@@ -243,7 +243,8 @@ class SFTucker(Tucker):
         :param a: Scalar value.
         :return: `SFTucker` tensor.
         """
-        return SFTucker(a * self.core, self.regular_factors, self.num_shared_factors, self.shared_factor)
+        return SFTucker(a * self.core, self.regular_factors, self.num_shared_factors,
+                        self.shared_factor)._mark_orthonormal(self._factors_orthonormal)
 
     def __neg__(self):
         return (-1) * self
@@ -270,8 +271,8 @@ class SFTucker(Tucker):
         factors = [None] * self.dt
         intermediate_factors = [None] * self.dt
         for i in range(self.dt):
-            factors[i], intermediate_factors[i] = back.qr(self.regular_factors[i])
-        shared_Q, shared_R = back.qr(self.shared_factor)
+            factors[i], intermediate_factors[i] = back.qr(back.astype(self.regular_factors[i], self.dtype))
+        shared_Q, shared_R = back.qr(back.astype(self.shared_factor, self.dtype))
         intermediate_core = SFTucker(self.core, intermediate_factors, self.num_shared_factors, shared_R).to_dense()
         intermediate_core = self.__sf_hosvd(intermediate_core, self.ds, sft_rank=max_rank, eps=eps)
 
@@ -289,7 +290,7 @@ class SFTucker(Tucker):
         shared_factor = shared_Q @ intermediate_core.shared_factor
         shared_factor = shared_factor[:, :max_rank[-1]]
         return SFTucker(intermediate_core.core[tuple(rank_slices)], factors,
-                        self.num_shared_factors, shared_factor)
+                        self.num_shared_factors, shared_factor)._mark_orthonormal()
 
     def flat_inner(self, other: "SFTucker"):
         """Calculate inner product of given `SFTucker` tensors.
@@ -300,29 +301,12 @@ class SFTucker(Tucker):
         if self.num_shared_factors != other.num_shared_factors:
             raise ValueError("Amount of shared factors doesn't match. You probably should convert tensors to regular"
                              "Tucker format.")
-        core_letters = ascii_letters[:self.ndim]
-        rev_letters = ascii_letters[self.ndim:][::-1]
-
-        factors = []
-        factors_letters = []
-        transposed_letters = []
-        intermediate_core_letters = []
-        shared_factor = other.shared_factor.T @ self.shared_factor
-        for i in range(1, self.ndim + 1):
-            if i <= self.dt:
-                factors.append(self.regular_factors[i - 1])
-                factors_letters.append(f"{ascii_letters[self.ndim + i]}{core_letters[i - 1]}")
-                transposed_letters.append(f"{ascii_letters[self.ndim + i]}{rev_letters[i - 1]}")
-                intermediate_core_letters.append(rev_letters[i - 1])
-            else:
-                factors.append(shared_factor)
-                factors_letters.append(ascii_letters[self.ndim + i] + core_letters[i - 1])
-                intermediate_core_letters.append(ascii_letters[self.ndim + i])
-
-        source = ",".join([core_letters] + factors_letters + transposed_letters)
-        intermediate_core = back.einsum(source + "->" + "".join(intermediate_core_letters),
-                                        self.core, *factors, *other.regular_factors)
-        return (intermediate_core * other.core).sum()
+        if self is other and self._factors_orthonormal:
+            return back.tensordot(self.core, self.core, axes=self.ndim)
+        shared_gram = _gram(other.shared_factor, self.shared_factor, self.dtype)
+        grams = [_gram(other.regular_factors[i], self.regular_factors[i], self.dtype) for i in range(self.dt)]
+        intermediate_core = back.jit(_mode_products)(self.core, grams + [shared_gram] * self.ds)
+        return back.tensordot(intermediate_core, other.core, axes=self.ndim)
 
     def k_mode_product(self, k: int, matrix: back.type()):
         """k-mode tensor-matrix contraction.
@@ -336,10 +320,8 @@ class SFTucker(Tucker):
         if k >= self.dt:
             raise ValueError(f"You are trying to contract by shared mode. Use method `shared_modes_product`.")
 
-        # new_tensor = deepcopy(self)
-        # new_tensor.regular_factors[k] = mat @ new_tensor.regular_factors[k]
-        # return new_tensor
-        regular_factors = self.regular_factors[:k] + [matrix @ self.regular_factors[k]] + self.regular_factors[k + 1:]
+        matrix, factor = _promote(matrix, self.regular_factors[k], self.dtype)
+        regular_factors = self.regular_factors[:k] + [matrix @ factor] + self.regular_factors[k + 1:]
         return SFTucker(self.core, regular_factors, self.num_shared_factors, self.shared_factor)
 
     def shared_modes_product(self, matrix: back.type()):
@@ -348,7 +330,8 @@ class SFTucker(Tucker):
         :param matrix: Must contain `self.rank[-1]` columns.
         :return: `SFTucker` tensor.
         """
-        new_shared_factor = matrix @ self.shared_factor
+        matrix, shared_factor = _promote(matrix, self.shared_factor, self.dtype)
+        new_shared_factor = matrix @ shared_factor
         return SFTucker(self.core, self.regular_factors, self.num_shared_factors, new_shared_factor)
 
     def norm(self, qr_based: bool = False):
@@ -360,30 +343,44 @@ class SFTucker(Tucker):
         :return: Non-negative number which is the Frobenius norm of `SFTucker` tensor.
         """
         if qr_based:
-            common_factors = [back.qr(self.regular_factors[i])[1] for i in range(self.dt)]
-            shared_factor = back.qr(self.shared_factor)[1]
-            new_tensor = SFTucker(self.core, common_factors,
-                                  self.num_shared_factors, shared_factor)
-            new_tensor = new_tensor.to_dense()
-            return back.norm(new_tensor)
+            if self._factors_orthonormal:
+                return back.norm(self.core)
+            regular_factors = [back.qr(back.astype(self.regular_factors[i], self.dtype))[1] for i in range(self.dt)]
+            shared_factor = back.qr(back.astype(self.shared_factor, self.dtype))[1]
+            return back.norm(back.jit(_mode_products)(self.core, regular_factors + [shared_factor] * self.ds))
 
         return back.sqrt(self.flat_inner(self))
 
+    def to_bf16(self):
+        """Convert regular and shared factors to bfloat16 keeping the core in its current precision. See
+        `Tucker.to_bf16` for operations which are performed in bfloat16.
+
+        :return: `SFTucker` tensor with bfloat16 factors.
+        """
+        return replace(self, factors=[back.astype(factor, back.bfloat16) for factor in self.regular_factors],
+                       shared_factor=back.astype(self.shared_factor, back.bfloat16))
+
+    def _to_core_precision(self):
+        """Cast regular and shared factors to precision of the core.
+
+        :return: `self` if factors are already in precision of the core, otherwise `SFTucker` tensor with cast factors.
+        """
+        if all(factor.dtype == self.dtype for factor in self.regular_factors + [self.shared_factor]):
+            return self
+        return replace(self, factors=[back.astype(factor, self.dtype) for factor in self.regular_factors],
+                       shared_factor=back.astype(self.shared_factor, self.dtype))
+
     def to_dense(self):
         """Convert `SFTucker` tensor to dense representation.
 
         :return: Dense d-dimensional representation of `SFTucker` tensor.
         """
-        core_letters = ascii_letters[:self.ndim]
-        factor_letters = [f"{ascii_letters[self.ndim + i]}{ascii_letters[i]}" for i in range(self.ndim)]
-        tensor_letters = ascii_letters[self.ndim:2 * self.ndim]
         factors = self.regular_factors + [self.shared_factor] * self.ds
-        einsum_str = core_letters + "," + ",".join(factor_letters) + "->" + tensor_letters
-        return back.einsum(einsum_str, self.core, *factors)
+        return back.jit(_mode_products)(self.core, factors)
 
     def __deepcopy__(self, memodict={}):
         new_core = back.copy(self.core)
         common_factors = [back.copy(factor) for factor in self.regular_factors]
         shared_factor = back.copy(self.shared_factor)
-        return self.__class__(new_core, common_factors,
-                              self.num_shared_factors, shared_factor)
+        return self.__class__(new_core, common_factors, self.num_shared_factors,
+                              shared_factor)._mark_orthonormal(self._factors_orthonormal)
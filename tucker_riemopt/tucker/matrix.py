@@ -1,4 +1,3 @@
-from string import ascii_letters
 from dataclasses import dataclass
 from typing import Sequence, Union
 
@@ -33,7 +32,7 @@ class TuckerMatrix(Tucker):
         if n is None or m is None:
             raise ValueError("n and m parameter must be specialized for matrices")
         dense_tensor = cls._hosvd(dense_tensor, eps=eps)
-        return cls(dense_tensor.core, dense_tensor.factors, n, m)
+        return cls(dense_tensor.core, dense_tensor.factors, n, m)._mark_orthonormal()
 
     def __matmul__(self, other: Union[back.type(), Tucker, "TuckerMatrix"]):
         """Perform matrix multiplication of tensors. If other's ndim > matrix ndim, then perform batch matmul over last
@@ -46,20 +45,13 @@ class TuckerMatrix(Tucker):
         :return: Dense tensor, Tucker or TuckerMatrix, depends on type of `other`.
         """
         if type(other) == back.type():
-            core_letters = ascii_letters[:self.ndim]
-            factors_letters = []
-            operand_letters = []
-            result_letters = []
-            reshaped_factors = []
+            # operand axes are `ndim + 2 * i`, result axes are `ndim + 2 * i + 1`, core axes are `i`
+            operands = [self.core, list(range(self.ndim))]
             for i in range(self.ndim):
-                reshaped_factors.append(back.reshape(self.factors[i], (self.n[i], self.m[i], -1), order="F"))
-                factors_letters.append(ascii_letters[self.ndim + 2 * i: self.ndim + 2 * (i + 1)] + core_letters[i])
-                operand_letters.append(factors_letters[-1][0])
-                result_letters.append(factors_letters[-1][1])
-            batch_letters = []
-            for i in range(len(other.shape) - self.ndim):
-                batch_letters.append(ascii_letters[2 * (self.ndim + 1) + i + 1])
-            operand_letters = batch_letters + operand_letters
-            result_letters =  batch_letters + result_letters
-            return back.einsum(f"{core_letters},{','.join(factors_letters)},{''.join(operand_letters)}->{''.join(result_letters)}",
-                               self.core, *reshaped_factors, other)
+                factor = back.astype(self.factors[i], self.dtype)
+                operands += [back.reshape(factor, (self.n[i], self.m[i], -1), order="F"),
+                             [self.ndim + 2 * i, self.ndim + 2 * i + 1, i]]
+            batch_axes = list(range(3 * self.ndim, 3 * self.ndim + len(other.shape) - self.ndim))
+            operand_axes = batch_axes + [self.ndim + 2 * i for i in range(self.ndim)]
+            result_axes = batch_axes + [self.ndim + 2 * i + 1 for i in range(self.ndim)]
+            return back.einsum(*operands, other, operand_axes, result_axes)
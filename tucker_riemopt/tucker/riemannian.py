@@ -110,6 +110,8 @@ def grad(f: Callable[[Tucker], float], X: Tucker, retain_graph=False) -> Tuple[T
     :param retain_graph: Optional argument, which may be provided to autodiff framework (e.g. pytorch).
     :return: A tangent vector of `X` which is the Riemannian gradient of `f` and value `f(X)`.
     """
+    # factors stored in bfloat16 (see `to_bf16`) are not supported by the linear algebra below
+    X = X._to_core_precision()
     fx = None
     def h(delta_core, delta_factors):
         nonlocal X, fx
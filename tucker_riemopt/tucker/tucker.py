@@ -2,9 +2,8 @@ import numpy as np
 import warnings
 
 from typing import Union, Sequence, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from string import ascii_letters
-from copy import deepcopy
 from scipy.sparse.linalg import LinearOperator, svds
 
 from tucker_riemopt import backend as back
@@ -13,6 +12,48 @@ from tucker_riemopt.sparse import SparseTensor
 ML_rank = Union[int, Sequence[int]]
 
 
+def _mode_products(core: back.type(), matrices: Sequence[back.type()]) -> back.type():
+    """Contract every mode of `core` with the corresponding matrix. The k-th mode of `core` is contracted with columns
+    of `matrices[k]`.
+
+    :param core: Tensor to contract.
+    :param matrices: Sequence of `core.ndim` matrices. Matrices are cast to the precision of `core`.
+    :return: Tensor with k-th dimension equal to number of rows of `matrices[k]`.
+    """
+    # each contraction consumes the leading mode and appends the new one to the end, so after all `ndim`
+    # contractions modes are back in their original order
+    for matrix in matrices:
+        if matrix.dtype != core.dtype:
+            matrix = back.astype(matrix, core.dtype)
+        core = back.tensordot(core, matrix, axes=([0], [1]))
+    return core
+
+
+def _promote(a: back.type(), b: back.type(), dtype):
+    """Cast `a` and `b` to `dtype` if their precisions differ.
+
+    :param a: Tensor.
+    :param b: Tensor.
+    :param dtype: Common precision for operands of different precisions.
+    :return: Pair of tensors of the same precision.
+    """
+    if a.dtype != b.dtype:
+        return back.astype(a, dtype), back.astype(b, dtype)
+    return a, b
+
+
+def _gram(a: back.type(), b: back.type(), dtype) -> back.type():
+    """Compute `a.T @ b`. If precisions of `a` and `b` differ, both are cast to `dtype`.
+
+    :param a: Matrix.
+    :param b: Matrix with the same number of rows as `a`.
+    :param dtype: Precision of the product for operands of different precisions.
+    :return: Matrix of shape `(a.shape[1], b.shape[1])`.
+    """
+    a, b = _promote(a, b, dtype)
+    return a.T @ b
+
+
 @dataclass()
 class Tucker:
     """Tucker tensor factorisation.
@@ -22,6 +63,26 @@ class Tucker:
     """
     core: back.type() = field(default_factory=back.tensor)
     factors: List[back.type()] = field(default_factory=list)
+    # whether all factors are known to have orthonormal columns; set by decompositions which produce such factors
+    # and reset whenever factors are reassigned (see `__setattr__`)
+    _factors_orthonormal: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("factors", "shared_factor"):
+            super().__setattr__("_factors_orthonormal", False)
+
+    def _mark_orthonormal(self, orthonormal: bool = True):
+        """Set flag, which indicates that all factors have orthonormal columns. The flag is dropped when `factors` (or
+        `shared_factor`) attribute is reassigned. In-place modification of the factors list (e.g. `t.factors[k] = U`)
+        can not be tracked and invalidates the flag as well, so code doing it must reset the flag explicitly with
+        `_mark_orthonormal(False)`.
+
+        :param orthonormal: Value of the flag.
+        :return: `self`.
+        """
+        self._factors_orthonormal = orthonormal
+        return self
 
     @staticmethod
     def __HOOI(sparse_tensor, sparse_tucker, contraction_dict, maxiter):
@@ -49,6 +110,7 @@ class Tucker:
 
                 contraction_dict[k] = factor.T
                 sparse_tucker.factors[k] = factor
+                sparse_tucker._mark_orthonormal(False)
 
             tucker_core = sparse_tensor.contract(contraction_dict)
             tucker_core = tucker_core.to_dense()
@@ -101,7 +163,7 @@ class Tucker:
         core_letters = ascii_letters[d: 2 * d]
         einsum_str = tensor_letters + "," + ",".join(factor_letters) + "->" + core_letters
         core = back.einsum(einsum_str, dense_tensor, *factors)
-        return cls(core, factors)
+        return cls(core, factors)._mark_orthonormal()
 
     @classmethod
     def from_dense(cls, dense_tensor: back.type(), eps=1e-14):
@@ -138,7 +200,7 @@ class Tucker:
         sparse_tucker = cls(core=back.tensor(core.to_dense()), factors=factors)
         if maxiter is not None:
             sparse_tucker = cls.__HOOI(sparse_tensor, sparse_tucker, contraction_dict, maxiter)
-        return sparse_tucker
+        return sparse_tucker._mark_orthonormal()
 
     @property
     def ndim(self) -> int:
@@ -154,7 +216,7 @@ class Tucker:
 
         :return: Sequence that represents the shape of `Tucker` tensor.
         """
-        return [self.factors[i].shape[0] for i in range(self.ndim)]
+        return [factor.shape[0] for factor in self.factors]
 
     @property
     def rank(self) -> Sequence[int]:
@@ -180,11 +242,12 @@ class Tucker:
         """
         r1 = self.rank
         r2 = other.rank
-        padded_core1 = back.pad(self.core, [(0, r2[j]) if j > 0 else (0, 0) for j in range(self.ndim)],
-                                mode="constant", constant_values=0)
-        padded_core2 = back.pad(other.core, [(r1[j], 0) if j > 0 else (0, 0) for j in range(other.ndim)],
-                                mode="constant", constant_values=0)
-        core = back.concatenate((padded_core1, padded_core2), axis=0)
+        context = back.context(self.core)
+        context.pop("requires_grad", None)
+        context["dtype"] = back.result_type(self.core, other.core)
+        core = back.zeros([r1[j] + r2[j] for j in range(self.ndim)], **context)
+        core = back.update_index(core, tuple(slice(0, r1[j]) for j in range(self.ndim)), self.core)
+        core = back.update_index(core, tuple(slice(r1[j], None) for j in range(self.ndim)), other.core)
         factors = [back.concatenate((self.factors[i], other.factors[i]), axis=1) for i in range(self.ndim)]
         return Tucker(core, factors)
 
@@ -197,7 +260,7 @@ class Tucker:
         core = back.kron(self.core, other.core)
         factors = []
         for i in range(self.ndim):
-            contraction = back.einsum('ia,ib->iab', self.factors[i], other.factors[i])
+            contraction = back.einsum('ia,ib->iab', *_promote(self.factors[i], other.factors[i], core.dtype))
             contraction = back.reshape(contraction, (self.factors[i].shape[0], -1), order="C")
             factors.append(contraction)
         return Tucker(core, factors)
@@ -208,7 +271,7 @@ class Tucker:
         :param a: Scalar value.
         :return: `Tucker` tensor.
         """
-        return Tucker(a * self.core, self.factors)
+        return Tucker(a * self.core, self.factors)._mark_orthonormal(self._factors_orthonormal)
 
     def __neg__(self):
         return (-1) * self
@@ -224,11 +287,11 @@ class Tucker:
          element on (i, j, k) position A[[i1, i2], [j1, j2], [k1, k2]] will return 2 elements on positions (i1, j1, k1)
          and (i2, j2, k2) correspondingly.
         """
+        factors = [back.astype(factor, self.dtype) for factor in self.factors]
         if type(key[0]) is int:
-            return back.einsum("ijk,i,j,k->", self.core, self.factors[0][key[0]],
-                               self.factors[1][key[1]], self.factors[2][key[2]])
+            return back.einsum("ijk,i,j,k->", self.core, factors[0][key[0]], factors[1][key[1]], factors[2][key[2]])
         else:
-            new_factors = [self.factors[i][key[:, i], :] for i in np.arange(self.ndim)]
+            new_factors = [factors[i][key[:, i], :] for i in np.arange(self.ndim)]
             tensor_letters = ascii_letters[:self.ndim]
             einsum_rule = tensor_letters + ',' + ','.join('A' + c for c in tensor_letters) + '->A'
 
@@ -251,7 +314,7 @@ class Tucker:
         factors = [None] * self.ndim
         intermediate_factors = [None] * self.ndim
         for i in range(self.ndim):
-            factors[i], intermediate_factors[i] = back.qr(self.factors[i])
+            factors[i], intermediate_factors[i] = back.qr(back.astype(self.factors[i], self.dtype))
         intermediate_core = Tucker(self.core, intermediate_factors)
         intermediate_core = self._hosvd(intermediate_core.to_dense(), ml_rank=max_rank, eps=eps)
 
@@ -265,7 +328,7 @@ class Tucker:
             rank_slices.append(slice(0, max_rank[i]))
             factors[i] = factors[i] @ intermediate_core.factors[i]
             factors[i] = factors[i][:, :max_rank[i]]
-        return Tucker(intermediate_core.core[tuple(rank_slices)], factors)
+        return Tucker(intermediate_core.core[tuple(rank_slices)], factors)._mark_orthonormal()
 
     def flat_inner(self, other: "Tucker") -> float:
         """Calculate inner product of given `Tucker` tensors.
@@ -273,21 +336,11 @@ class Tucker:
         :param other: `Tucker` tensor.
         :return: Result of inner product.
         """
-        core_letters = ascii_letters[:self.ndim]
-        rev_letters = ascii_letters[self.ndim:][::-1]
-
-        factors_letters = []
-        transposed_letters = []
-        intermediate_core_letters = []
-        for i in range(1, self.ndim + 1):
-            factors_letters.append(f"{ascii_letters[self.ndim + i]}{core_letters[i - 1]}")
-            transposed_letters.append(f"{ascii_letters[self.ndim + i]}{rev_letters[i]}")
-            intermediate_core_letters.append(rev_letters[i])
-
-        source = ",".join([core_letters] + factors_letters + transposed_letters)
-        intermediate_core = back.einsum(source + "->" + "".join(intermediate_core_letters),
-                                        self.core, *self.factors, *other.factors)
-        return (intermediate_core * other.core).sum()
+        if self is other and self._factors_orthonormal:
+            return back.tensordot(self.core, self.core, axes=self.ndim)
+        grams = [_gram(other.factors[i], self.factors[i], self.dtype) for i in range(self.ndim)]
+        intermediate_core = back.jit(_mode_products)(self.core, grams)
+        return back.tensordot(intermediate_core, other.core, axes=self.ndim)
 
     def k_mode_product(self, k: int, matrix: back.type()):
         """k-mode tensor-matrix contraction.
@@ -299,7 +352,8 @@ class Tucker:
         if k < 0 or k >= self.ndim:
             raise ValueError(f"k should be from 0 to {self.ndim - 1}")
 
-        new_factors = self.factors[:k] + [matrix @ self.factors[k]] + self.factors[k + 1:]
+        matrix, factor = _promote(matrix, self.factors[k], self.dtype)
+        new_factors = self.factors[:k] + [matrix @ factor] + self.factors[k + 1:]
         return Tucker(self.core, new_factors)
 
     def norm(self, qr_based: bool = False) -> float:
@@ -310,25 +364,41 @@ class Tucker:
         :return: Non-negative number which is the Frobenius norm of `Tucker` tensor.
         """
         if qr_based:
-            core_factors = [back.qr(self.factors[i])[1] for i in range(self.ndim)]
-            new_tensor = Tucker(self.core, core_factors)
-            new_tensor = new_tensor.to_dense()
-            return back.norm(new_tensor)
+            if self._factors_orthonormal:
+                return back.norm(self.core)
+            core_factors = [back.qr(back.astype(self.factors[i], self.dtype))[1] for i in range(self.ndim)]
+            return back.norm(back.jit(_mode_products)(self.core, core_factors))
 
         return back.sqrt(self.flat_inner(self))
 
+    def to_bf16(self):
+        """Convert factors to bfloat16 keeping the core in its current precision. Only Gram matrices of factors in
+        `flat_inner` and differentiable `norm` of tensors with bfloat16 factors are computed in bfloat16; contractions
+        with the core are accumulated in precision of the core. All other routines (`to_dense`, QR-based `norm`,
+        `round`, products with matrices, Riemannian gradients) cast factors to precision of the core on each call, so
+        for them bfloat16 factors only save memory.
+
+        :return: `Tucker` tensor with bfloat16 factors.
+        """
+        return replace(self, factors=[back.astype(factor, back.bfloat16) for factor in self.factors])
+
+    def _to_core_precision(self):
+        """Cast factors to precision of the core. Inverse of `to_bf16` for routines which need full precision factors.
+
+        :return: `self` if factors are already in precision of the core, otherwise `Tucker` tensor with cast factors.
+        """
+        if all(factor.dtype == self.dtype for factor in self.factors):
+            return self
+        return replace(self, factors=[back.astype(factor, self.dtype) for factor in self.factors])
+
     def to_dense(self) -> back.type():
         """Convert `Tucker` tensor to dense representation.
 
         :return: Dense d-dimensional representation of `Tucker` tensor.
         """
-        core_letters = ascii_letters[:self.ndim]
-        factor_letters = [f"{ascii_letters[self.ndim + i]}{ascii_letters[i]}" for i in range(self.ndim)]
-        tensor_letters = ascii_letters[self.ndim:2 * self.ndim]
-        einsum_str = core_letters + "," + ",".join(factor_letters) + "->" + tensor_letters
-        return back.einsum(einsum_str, self.core, *self.factors)
+        return back.jit(_mode_products)(self.core, self.factors)
 
     def __deepcopy__(self, memodict={}):
         new_core = back.copy(self.core)
         new_factors = [back.copy(factor) for factor in self.factors]
-        return self.__class__(new_core, new_factors)
+        return self.__class__(new_core, new_factors)._mark_orthonormal(self._factors_orthonormal)